@@ -0,0 +1,17 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+import json
+from NetworkingCalculators import aggregate_routing_table
+
+
+if __name__ == '__main__':
+    routing_table = [  # binary (spaces every EIGHT binary digits) or CIDR strings both work
+        '10011110 00011110 10001110',
+        '10011110 00011110 10001111',  # sibling of the prefix above, same port: they merge
+        '10011110 00011110 10001111 000',  # covered by a shorter prefix with the same port: dropped
+        '10011110 00011110 10001111 01'
+    ]
+    output_ports = [1, 1, 1, 2]
+
+    result = aggregate_routing_table(routing_table, output_ports)
+    print('\naggregated routing table:\n', json.dumps(result, indent=4))
@@ -0,0 +1,31 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+
+from NetworkingCalculators import stuff_bytes_buffer, unstuff_bytes
+
+
+if __name__ == '__main__':
+    # raw bytes instead of a hex string
+    input_bytes = bytes([0x78, 0x04, 0x1B, 0x7A, 0x01, 0x1B])
+    special_chars_to_escape_char_list = {
+        'soh': ['esc', 'x'],
+        'eot': ['esc', 'y'],
+        'esc': ['esc', 'z'],
+    }
+    hex_conversion_table = {
+        'soh': '01h',
+        'eot': '04h',
+        'esc': '1Bh',
+        'x':   '78h',
+        'y':   '79h',
+        'z':   '7Ah'
+    }
+    include_framing_chars = True
+
+    stuffed = stuff_bytes_buffer(
+        input_bytes, special_chars_to_escape_char_list, hex_conversion_table, include_framing_chars
+    )
+    print('stuffed bytes:  ', stuffed.hex(' ').upper())
+
+    unstuffed = unstuff_bytes(stuffed, special_chars_to_escape_char_list, hex_conversion_table, include_framing_chars)
+    print('unstuffed bytes:', unstuffed.hex(' ').upper())
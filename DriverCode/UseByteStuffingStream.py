@@ -0,0 +1,31 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+
+from NetworkingCalculators import ByteStuffingEncoder, ByteStuffingDecoder
+
+
+if __name__ == '__main__':
+    special_chars_to_escape_char_list = {
+        'soh': ['esc', 'x'],
+        'eot': ['esc', 'y'],
+        'esc': ['esc', 'z'],
+    }
+    hex_conversion_table = {
+        'soh': '01h',
+        'eot': '04h',
+        'esc': '1Bh',
+        'x':   '78h',
+        'y':   '79h',
+        'z':   '7Ah'
+    }
+    payloads = [bytes([0x78, 0x04, 0x1B, 0x7A, 0x01, 0x1B]), b'second frame']
+
+    encoder = ByteStuffingEncoder(special_chars_to_escape_char_list, hex_conversion_table)
+    stream = b''.join([encoder.encode_frame(payload) for payload in payloads])
+
+    # pretend the stream arrives 5 bytes per read
+    decoder = ByteStuffingDecoder(special_chars_to_escape_char_list, hex_conversion_table)
+    read_size = 5
+    for start in range(0, len(stream), read_size):
+        for frame in decoder.feed(stream[start:start + read_size]):
+            print('frame received:', frame)
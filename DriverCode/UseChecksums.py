@@ -0,0 +1,55 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+
+import os
+import time
+import zlib
+
+from NetworkingCalculators import CRC_16_HDLC, CRC_32, InternetChecksum, internet_checksum, stuff_bytes_buffer
+
+
+if __name__ == '__main__':
+    special_chars_to_escape_char_list = {
+        'soh': ['esc', 'x'],
+        'eot': ['esc', 'y'],
+        'esc': ['esc', 'z'],
+    }
+    hex_conversion_table = {
+        'soh': '01h',
+        'eot': '04h',
+        'esc': '1Bh',
+        'x':   '78h',
+        'y':   '79h',
+        'z':   '7Ah'
+    }
+    frame = stuff_bytes_buffer(
+        bytes([0x78, 0x04, 0x1B, 0x7A, 0x01, 0x1B]), special_chars_to_escape_char_list, hex_conversion_table, True
+    )
+    print('frame:           ', frame.hex(' ').upper())
+    print('Internet checksum:', hex(internet_checksum(frame)))
+    print('CRC-16 (HDLC FCS):', hex(CRC_16_HDLC.compute(frame)))
+    print('CRC-32:           ', hex(CRC_32.compute(frame)))
+
+    # incremental: chunk by chunk gives the same result as all at once
+    checksum = InternetChecksum()
+    crc = None
+    for i in range(0, len(frame), 3):
+        checksum.update(frame[i:i + 3])
+        crc = CRC_32.compute(frame[i:i + 3], crc)
+    print('incremental matches:', checksum.checksum() == internet_checksum(frame) and crc == CRC_32.compute(frame))
+
+    # throughput against zlib.crc32, which computes the same CRC-32 in C
+    data = os.urandom(4_000_000)
+    start = time.perf_counter()
+    table_crc = CRC_32.compute(data)
+    table_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    zlib_crc = zlib.crc32(data)
+    zlib_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    internet_checksum(data)
+    checksum_seconds = time.perf_counter() - start
+    print('CRC-32 matches zlib:', table_crc == zlib_crc)
+    print(f'CRC-32 (table):    {len(data) / table_seconds / 1e6:8.1f} MB/s')
+    print(f'zlib.crc32:        {len(data) / zlib_seconds / 1e6:8.1f} MB/s')
+    print(f'Internet checksum: {len(data) / checksum_seconds / 1e6:8.1f} MB/s')
@@ -0,0 +1,33 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+
+import numpy as np
+
+from NetworkingCalculators import (calculate_bit_time_ms_array, calculate_effective_delay_ms_array,
+                                   calculate_end_to_end_delay_packet_switched_ms,
+                                   calculate_end_to_end_delay_packet_switched_ms_array,
+                                   calculate_network_utilization_array, calculate_transmission_time_simple_ms_array)
+
+
+if __name__ == '__main__':
+    # give each parameter its own axis, and numpy broadcasting evaluates the whole grid in one call
+    packet_sizes_bytes = np.array([64, 576, 1500, 9000])[:, None, None]
+    rates_in_Mbps = np.array([10, 100, 1000, 10000])[None, :, None]
+    distances_km = np.array([1, 100, 1000, 10000])[None, None, :]
+    propagation_mps = {'significant_digits': 2, 'exponent': 8}
+
+    end_to_end_delays_ms = calculate_end_to_end_delay_packet_switched_ms_array(
+        packet_sizes_bytes, rates_in_Mbps, 1, distances_km, propagation_mps, intermediate_router_count=3)
+    print(f'end-to-end delay grid shape: {end_to_end_delays_ms.shape}')
+    print(f'1500 bytes at 100 Mbps over 1000 km: {end_to_end_delays_ms[2, 1, 2]} ms')
+    print(f'same from the scalar calculator:     '
+          f'{calculate_end_to_end_delay_packet_switched_ms(1500, 100, 1, 1000, propagation_mps, 3)} ms')
+    print()
+
+    print(f'transmission times (ms), sizes x rates:\n'
+          f'{calculate_transmission_time_simple_ms_array(packet_sizes_bytes[:, :, 0], rates_in_Mbps[:, :, 0])}')
+    print(f'stop-and-wait utilization at 30 ms RTT, sizes x rates:\n'
+          f'{calculate_network_utilization_array(packet_sizes_bytes[:, :, 0], rates_in_Mbps[:, :, 0], 30)}')
+    print(f'bit times (ms): {calculate_bit_time_ms_array(rates_in_Mbps.ravel())}')
+    print(f'effective delay of a 10 ms link as utilization rises: '
+          f'{calculate_effective_delay_ms_array(np.linspace(0, 0.9, 4), 10)}')
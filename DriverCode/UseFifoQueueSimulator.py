@@ -0,0 +1,45 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+
+from NetworkingCalculators import (calculate_effective_delay_ms, calculate_mean_queuing_delay_ms,
+                                   generate_md1_arrivals, generate_mm1_arrivals, generate_trace_replay_arrivals,
+                                   simulate_fifo_queue)
+
+
+if __name__ == '__main__':
+    rate_in_Mbps = 100
+    packet_size_bytes = 1000
+    transmission_time_ms = packet_size_bytes * 8 / (rate_in_Mbps * 1000 * 1000) * 1000
+    packet_count = 1_000_000
+
+    for utilization_decimal in (0.5, 0.8, 0.95):
+        arrival_rate_per_second = utilization_decimal / transmission_time_ms * 1000
+
+        # M/M/1: mean sojourn time should match D / (1 - U)
+        arrival_times_seconds, packet_sizes_bytes = generate_mm1_arrivals(arrival_rate_per_second, packet_size_bytes,
+                                                                          packet_count, seed=1)
+        results = simulate_fifo_queue(arrival_times_seconds, packet_sizes_bytes, rate_in_Mbps)
+        sojourn_time_summary_ms = results['sojourn_time_summary_ms']
+        print(f'M/M/1 at U = {utilization_decimal}: mean delay {sojourn_time_summary_ms["mean"]:.4f} ms '
+              f'(analytic {calculate_effective_delay_ms(utilization_decimal, transmission_time_ms):.4f} ms), '
+              f'p50 {sojourn_time_summary_ms["p50"]:.4f} ms, p99 {sojourn_time_summary_ms["p99"]:.4f} ms, '
+              f'p99.9 {sojourn_time_summary_ms["p999"]:.4f} ms')
+
+        # M/D/1: mean queuing delay should match Pollaczek-Khinchine with zero variance
+        arrival_times_seconds, packet_sizes_bytes = generate_md1_arrivals(arrival_rate_per_second, packet_size_bytes,
+                                                                          packet_count, seed=1)
+        results = simulate_fifo_queue(arrival_times_seconds, packet_sizes_bytes, rate_in_Mbps)
+        queuing_delay_summary_ms = results['queuing_delay_summary_ms']
+        analytic_queuing_delay_ms = calculate_mean_queuing_delay_ms(arrival_rate_per_second, transmission_time_ms, 0)
+        print(f'M/D/1 at U = {utilization_decimal}: mean queuing delay {queuing_delay_summary_ms["mean"]:.4f} ms '
+              f'(analytic {analytic_queuing_delay_ms:.4f} ms), p99 {queuing_delay_summary_ms["p99"]:.4f} ms, '
+              f'p99.9 {queuing_delay_summary_ms["p999"]:.4f} ms')
+
+    # replay a short bursty trace at twice its recorded load
+    trace_arrival_times_seconds = [0, 0.0001, 0.0002, 0.0003, 0.002, 0.0021, 0.005]
+    trace_packet_sizes_bytes = [1500, 1500, 1500, 64, 576, 1500, 64]
+    arrival_times_seconds, packet_sizes_bytes = generate_trace_replay_arrivals(
+        trace_arrival_times_seconds, trace_packet_sizes_bytes, packet_count, load_multiplier=2)
+    results = simulate_fifo_queue(arrival_times_seconds, packet_sizes_bytes, rate_in_Mbps)
+    print(f'trace replay: utilization {results["utilization_decimal"]:.3f}, '
+          f'queuing delay summary {results["queuing_delay_summary_ms"]}')
@@ -0,0 +1,31 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+
+import numpy as np
+
+from NetworkingCalculators import calculate_flow_completion_times_ms
+
+
+if __name__ == '__main__':
+    mss_bytes = 1460
+    slowstart_congestion_window_limit_bytes = 11680
+    rtt_ms = 30
+    rate_in_Mbps = 100
+
+    # a few flows typed in (a fractional size still needs its partial segment sent)...
+    flow_sizes_bytes = np.array([1460, 1460.5, 14600, 100_000, 10_000_000])
+    completion_times_ms = calculate_flow_completion_times_ms(
+        flow_sizes_bytes, mss_bytes, slowstart_congestion_window_limit_bytes, rtt_ms, rate_in_Mbps
+    )
+    for flow_size_bytes, completion_time_ms in zip(flow_sizes_bytes, completion_times_ms):
+        print(f'{flow_size_bytes:>12} bytes: {completion_time_ms:10.3f} ms')
+
+    # ...and a million drawn from a heavy-tailed (Pareto) size distribution
+    random_number_generator = np.random.default_rng(0)
+    flow_sizes_bytes = random_number_generator.pareto(1.2, 1_000_000) * 10_000 + 1
+    completion_times_ms = calculate_flow_completion_times_ms(
+        flow_sizes_bytes, mss_bytes, slowstart_congestion_window_limit_bytes, rtt_ms, rate_in_Mbps
+    )
+    print('\ncompletion time percentiles (ms):')
+    for percentile in (50, 90, 99, 99.9):
+        print(f'  p{percentile}: {np.percentile(completion_times_ms, percentile):.3f}')
@@ -0,0 +1,25 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+
+import numpy as np
+
+from NetworkingCalculators import FlowRttTable
+
+
+if __name__ == '__main__':
+    flow_count = 1_000_000
+    flow_rtt_table = FlowRttTable(flow_count, dtype=np.float32)
+
+    # one batch of (flow id, sample RTT) pairs; flow 7 has two samples, applied in order
+    flow_ids = [7, 42, 7, 999_999]
+    sample_rtts_ms = [33.1, 80.0, 24.8, 11.1]
+    retransmitted = [False, False, False, True]  # ignored (Karn's algorithm)
+    flow_rtt_table.add_samples(flow_ids, sample_rtts_ms, retransmitted)
+    flow_rtt_table.on_timeouts([42])
+
+    for flow_id in (7, 42, 999_999):
+        print(f'flow {flow_id}: estimated RTT {flow_rtt_table.estimated_rtts_ms[flow_id]:.3f} ms, '
+              f'dev RTT {flow_rtt_table.dev_rtts_ms[flow_id]:.3f} ms, '
+              f'timeout {flow_rtt_table.timeout_intervals_ms[flow_id]:.3f} ms')
+    print('bytes per flow:', flow_rtt_table.memory_bytes_per_flow)
+    print(f'total (MB): {flow_rtt_table.memory_bytes / 1e6:.1f}')
@@ -0,0 +1,19 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+
+from NetworkingCalculators import HdlcBitStuffer, hdlc_bit_destuff, hdlc_bit_stuff
+
+
+if __name__ == '__main__':
+    frame = bytes([0x7E, 0xFF, 0x3F])
+
+    stuffed, stuffed_bit_count = hdlc_bit_stuff(frame)
+    print('original bits:', ' '.join(f'{byte:08b}' for byte in frame))
+    print('stuffed bits: ', ''.join(f'{byte:08b}' for byte in stuffed)[:stuffed_bit_count])
+    print('destuffed:    ', hdlc_bit_destuff(stuffed, stuffed_bit_count).hex(' ').upper())
+
+    # same frame, fed one byte at a time
+    bit_stuffer = HdlcBitStuffer()
+    streamed = b''.join(bit_stuffer.feed(frame[i:i + 1]) for i in range(len(frame)))
+    last_byte, last_byte_bit_count = bit_stuffer.flush()
+    print('streamed matches:', (streamed + last_byte, len(streamed) * 8 + last_byte_bit_count) == (stuffed, stuffed_bit_count))
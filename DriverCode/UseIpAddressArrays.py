@@ -0,0 +1,22 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+import numpy as np
+from NetworkingCalculators import ipv4_addresses_to_array, int_to_ip_address
+
+
+if __name__ == '__main__':
+    # newline-separated buffer, e.g. read straight from a file of addresses
+    ip_address_buffer = b'158.30.142.30\n158.30.143.5\n10.0.0.1\n'
+
+    ip_address_array = ipv4_addresses_to_array(ip_address_buffer)
+    print('packed addresses:', [hex(ip_address) for ip_address in ip_address_array])
+    print('as numpy uint32:', np.frombuffer(ip_address_array, dtype=np.uint32))
+    print('back to text:', [int_to_ip_address(ip_address) for ip_address in ip_address_array])
+
+    # malformed buffers are rejected, with or without numpy
+    for malformed_buffer in (b'1.2.3.4.5.6.7 8', b'1.2.3 4.5.6.7.8', b'010.1.1.1'):
+        try:
+            ipv4_addresses_to_array(malformed_buffer)
+            print(f'{malformed_buffer!r}: accepted')
+        except OSError as error:
+            print(f'{malformed_buffer!r}: rejected ({error})')
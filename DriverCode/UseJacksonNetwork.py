@@ -0,0 +1,43 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+
+import numpy as np
+
+from NetworkingCalculators import solve_jackson_network
+
+
+if __name__ == '__main__':
+    # ingress router -> core router -> one of two egress routers; 10% of packets at the core are retransmitted
+    external_arrival_rates_per_second = [8000, 0, 0, 0]
+    service_rates_per_second = [10000, 20000, 6000, 6000]
+    routing_probabilities = [
+        [0, 1, 0, 0],
+        [0, 0.1, 0.6, 0.3],
+        [0, 0, 0, 0],
+        [0, 0, 0, 0]
+    ]
+    results = solve_jackson_network(external_arrival_rates_per_second, service_rates_per_second,
+                                    routing_probabilities)
+    for node in range(len(service_rates_per_second)):
+        print(f'node {node}: {results["arrival_rates_per_second"][node]:.1f} packets/s, '
+              f'utilization {results["utilizations_decimal"][node]:.3f}, '
+              f'mean queue length {results["mean_queue_lengths"][node]:.3f}, '
+              f'{results["mean_sojourn_times_ms"][node]:.4f} ms per visit, '
+              f'{results["end_to_end_sojourn_times_ms"][node]:.4f} ms to leave the network from here')
+    print(f'mean time in the network: {results["network_mean_sojourn_time_ms"]:.4f} ms')
+    print()
+
+    # random mesh of thousands of routers, each forwarding to 4 neighbors and delivering 10% of packets locally
+    node_count = 5000
+    neighbor_count = 4
+    random_generator = np.random.default_rng(1)
+    from_nodes = np.repeat(np.arange(node_count), neighbor_count)
+    to_nodes = random_generator.integers(0, node_count, node_count * neighbor_count)
+    probabilities = np.full(node_count * neighbor_count, 0.9 / neighbor_count)
+    external_arrival_rates_per_second = random_generator.uniform(10, 100, node_count)
+    service_rates_per_second = np.full(node_count, 5000.0)
+    results = solve_jackson_network(external_arrival_rates_per_second, service_rates_per_second,
+                                    (from_nodes, to_nodes, probabilities))
+    print(f'{node_count}-node mesh: busiest node utilization {results["utilizations_decimal"].max():.3f}, '
+          f'mean time in the network {results["network_mean_sojourn_time_ms"]:.4f} ms, '
+          f'worst entry point {results["end_to_end_sojourn_times_ms"].max():.4f} ms')
@@ -0,0 +1,48 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+
+import random
+
+from NetworkingCalculators import DeficitRoundRobinScheduler, LinkSimulator, kibs_to_bytes, mibs_to_bytes
+
+
+if __name__ == '__main__':
+    # same setup as calculate_transmission_time_statistical_multiplexing's example
+    link_simulator = LinkSimulator(total_link_rate_Mbps=37.6, scheduler='round_robin')
+    link_simulator.add_file('big download', mibs_to_bytes(11), packet_payload_size_bytes=1000,
+                            packet_header_size_bytes=24)
+    link_simulator.add_file('small download', kibs_to_bytes(36), packet_payload_size_bytes=1000,
+                            packet_header_size_bytes=24)
+    for flow in link_simulator.run():
+        print(f"{flow['flow_id']}: done at {flow['completion_time_seconds']} s")
+    print()
+
+    # the first computer's one packet is sent first, but calculate_transmission_time_statistical_multiplexing counts
+    #     its file as done when the round is; whole-round accounting counts the same way
+    for whole_round_accounting in (False, True):
+        link_simulator = LinkSimulator(total_link_rate_Mbps=8, whole_round_accounting=whole_round_accounting)
+        for computer, file_size_bytes in enumerate([1000, 3000]):
+            link_simulator.add_file(computer, file_size_bytes, packet_payload_size_bytes=1000,
+                                    packet_header_size_bytes=0)
+        print(f'whole-round accounting {whole_round_accounting}: files done at '
+              f"{[flow['completion_time_seconds'] for flow in link_simulator.run()]} s")
+    print()
+
+    # a bulk flow and a weighted interactive flow, with Poisson arrivals, under each scheduler
+    for scheduler in ('round_robin', 'wfq', DeficitRoundRobinScheduler(quantum_bits=1500 * 8)):
+        random.seed(1)
+        link_simulator = LinkSimulator(total_link_rate_Mbps=10, scheduler=scheduler)
+        link_simulator.add_flow('bulk', weight=1)
+        link_simulator.add_flow('interactive', weight=4)
+        for _ in range(2000):
+            link_simulator.add_packet('bulk', 1500)
+        arrival_time_seconds = 0.0
+        for _ in range(2000):
+            arrival_time_seconds += random.expovariate(1000)
+            link_simulator.add_packet('interactive', 200, arrival_time_seconds)
+
+        print(type(link_simulator.scheduler).__name__)
+        for flow in link_simulator.run():
+            print(f"  {flow['flow_id']}: {flow['packet_count']} packets, done at "
+                  f"{flow['completion_time_seconds']:.4f} s, mean delay {flow['mean_delay_seconds'] * 1000:.3f} ms, "
+                  f"max delay {flow['max_delay_seconds'] * 1000:.3f} ms")
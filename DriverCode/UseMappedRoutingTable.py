@@ -0,0 +1,24 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+import os
+import tempfile
+from NetworkingCalculators import RoutingTable, MappedRoutingTable
+
+
+if __name__ == '__main__':
+    routing_table = [  # binary (spaces every EIGHT binary digits) or CIDR strings both work
+        '10011110 00011110 10001111',
+        '10011110 00011110 10001111 000',
+        '10011110 00011110 10001111 01',
+        '10011110 00011110 10001110 0001'
+    ]
+    ip_address_dotted_decimal = '158.30.142.30'
+    compiled_file_path = os.path.join(tempfile.gettempdir(), 'routing_table.fib')
+
+    # compile once (e.g. in a build step)...
+    RoutingTable(routing_table).save_compiled(compiled_file_path)
+
+    # ...then every process maps the file and looks up right away
+    with MappedRoutingTable(compiled_file_path) as mapped_table:
+        result = mapped_table.lookup(ip_address_dotted_decimal)
+        print('\nprefix match output port:', result, '\nprefix matched:', routing_table[result])
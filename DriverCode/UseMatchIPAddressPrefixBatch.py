@@ -0,0 +1,19 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+import numpy as np
+from NetworkingCalculators import match_ip_address_prefix_batch
+
+
+if __name__ == '__main__':
+    routing_table = [  # use spaces every EIGHT binary digits (e.g., 10001100 00011011 01011101 01)
+        '10011110 00011110 10001111',
+        '10011110 00011110 10001111 000',
+        '10011110 00011110 10001111 01',
+        '10011110 00011110 10001110 0001'
+    ]
+
+    # addresses as packed uint32 (158.30.142.30, 158.30.143.5, 10.0.0.1)
+    ip_addresses = np.array([0x9E1E8E1E, 0x9E1E8F05, 0x0A000001], dtype=np.uint32)
+
+    result = match_ip_address_prefix_batch(ip_addresses, routing_table)
+    print('matched prefix index per address (-1 means no match):', result)
@@ -0,0 +1,41 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+
+import sys
+
+from NetworkingCalculators import (calculate_transmission_time_statistical_multiplexing, kibs_to_bytes,
+                                   run_parameter_sweep, simulate_tcp_slowstart)
+
+
+if __name__ == '__main__':  # the guard is required: worker processes import this file
+    output_directory = sys.argv[1] if len(sys.argv) > 1 else '.'
+
+    # every combination of MSS x slow start limit x flow size; rerun after an interruption to pick up where it left off
+    summary = run_parameter_sweep(
+        simulate_tcp_slowstart,
+        {
+            'mss_bytes': [536, 1220, 1460, 8960],
+            'slow_start_congestion_window_limit_bytes': [16 * 1024, 64 * 1024, 256 * 1024],
+            'packet_count': list(range(1, 2001))
+        },
+        f'{output_directory}/slowstart_sweep.jsonl', chunk_size=500)
+    print(summary)
+
+    # functions that take a known_data dict get each scenario as one argument
+    scenarios = [
+        {
+            'total_link_rate_Mbps': total_link_rate_Mbps,
+            'sharing_computers_count': 2,
+            'starting_time_seconds': 0,
+            'file_sizes_bytes': [kibs_to_bytes(first_file_kibs), kibs_to_bytes(second_file_kibs)],
+            'packet_payload_size_bytes': 1000,
+            'packet_header_size_bytes': 24
+        }
+        for total_link_rate_Mbps in (10, 37.6, 100)
+        for first_file_kibs in range(1, 1001, 10)
+        for second_file_kibs in range(1, 1001, 10)
+    ]
+    summary = run_parameter_sweep(calculate_transmission_time_statistical_multiplexing, scenarios,
+                                  f'{output_directory}/statistical_multiplexing_sweep.csv', chunk_size=1000,
+                                  pass_scenario_as_dict=True)
+    print(summary)
@@ -0,0 +1,62 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+
+import os
+import struct
+import sys
+import tempfile
+
+from NetworkingCalculators import (estimate_pcap_rtts, find_seq_and_ack_numbers, iterate_pcap_rtt_samples,
+                                   read_pcap_seq_and_ack_input)
+
+
+def write_example_capture(file_path: str):
+    """
+    Writes a small classic pcap file: a handshake, three data segments (the last one retransmitted), and their ACKs
+    """
+    client, server = (0x0A000001, 5000), (0x0A000002, 80)
+    syn, ack = 0x02, 0x10
+    packets = [  # (time in seconds, source, destination, seq number, ack number, flags, payload size)
+        (0.000, client, server, 1000, 0, syn, 0),
+        (0.050, server, client, 9000, 1001, syn | ack, 0),
+        (0.100, client, server, 1001, 9001, ack, 413),
+        (0.110, client, server, 1414, 9001, ack, 382),
+        (0.160, server, client, 9001, 1414, ack, 0),
+        (0.178, server, client, 9001, 1796, ack, 0),
+        (0.200, client, server, 1796, 9001, ack, 245),
+        (0.500, client, server, 1796, 9001, ack, 245),  # retransmission
+        (0.550, server, client, 9001, 2041, ack, 0),
+    ]
+    with open(file_path, 'wb') as capture_file:
+        capture_file.write(struct.pack('<IHHiIII', 0xA1B2C3D4, 2, 4, 0, 0, 65535, 1))
+        for time_seconds, source, destination, seq_number, ack_number, flags, payload_size in packets:
+            tcp_header = struct.pack('!HHIIBBHHH', source[1], destination[1], seq_number, ack_number, 5 << 4, flags,
+                                     65535, 0, 0)
+            ip_header = struct.pack('!BBHHHBBHII', 0x45, 0, 40 + payload_size, 0, 0, 64, 6, 0, source[0],
+                                    destination[0])
+            frame = bytes(12) + b'\x08\x00' + ip_header + tcp_header + bytes(payload_size)
+            capture_file.write(struct.pack('<IIII', int(time_seconds), round(time_seconds % 1 * 1e6), len(frame),
+                                           len(frame)))
+            capture_file.write(frame)
+
+
+if __name__ == '__main__':
+    # analyze the capture file given on the command line, or a small example one
+    if len(sys.argv) > 1:
+        capture_file_path = sys.argv[1]
+    else:
+        capture_file_path = os.path.join(tempfile.mkdtemp(), 'example.pcap')
+        write_example_capture(capture_file_path)
+
+    for rtt_sample in iterate_pcap_rtt_samples(capture_file_path):
+        print(f'{rtt_sample.timestamp_seconds:8.3f} s: RTT {rtt_sample.rtt_ms:7.3f} ms'
+              f'{" (retransmitted, ignored)" if rtt_sample.retransmitted else ""}')
+
+    for flow, rtt_estimator in estimate_pcap_rtts(capture_file_path).items():
+        print(f'{flow[0]}:{flow[1]} -> {flow[2]}:{flow[3]}: estimated RTT {rtt_estimator.estimated_rtt_ms:.3f} ms, '
+              f'dev RTT {rtt_estimator.dev_rtt_ms:.3f} ms, timeout {rtt_estimator.timeout_interval_ms:.3f} ms')
+
+    # the first data direction's segments, as find_seq_and_ack_numbers' input
+    seq_and_ack_input = read_pcap_seq_and_ack_input(capture_file_path)
+    for packet_name, packet_data in find_seq_and_ack_numbers(**seq_and_ack_input).items():
+        print(f'{packet_name}: {packet_data}')
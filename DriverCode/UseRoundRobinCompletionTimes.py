@@ -0,0 +1,38 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+
+import numpy as np
+
+from NetworkingCalculators import (calculate_round_robin_completion_times,
+                                   calculate_round_robin_completion_times_batch, kibs_to_bytes, mibs_to_bytes)
+
+
+if __name__ == '__main__':
+    total_link_rate_Mbps = 37.6
+    hosts = [  # in turn order
+        {
+            'file_sizes_bytes': [mibs_to_bytes(11)],
+            'packet_payload_size_bytes': 1000,
+            'packet_header_size_bytes': 24
+        },
+        {
+            'file_sizes_bytes': [kibs_to_bytes(36), kibs_to_bytes(500)],  # sent one after the other
+            'packet_payload_size_bytes': 1460,
+            'packet_header_size_bytes': 40
+        },
+        {
+            'file_sizes_bytes': [kibs_to_bytes(200)],
+            'packet_payload_size_bytes': 536,
+            'packet_header_size_bytes': 40
+        }
+    ]
+
+    for time_seconds, turn_order, file_index in calculate_round_robin_completion_times(total_link_rate_Mbps, hosts):
+        print(f'host {turn_order}, file {file_index}: done at {time_seconds:.6f} s')
+
+    # many what-if scenarios at once: one file per host, 100 hosts, 1000 scenarios
+    random_number_generator = np.random.default_rng(0)
+    file_sizes_bytes = random_number_generator.integers(1, mibs_to_bytes(1), (1000, 100))
+    completion_times_seconds = calculate_round_robin_completion_times_batch(total_link_rate_Mbps, file_sizes_bytes,
+                                                                            1000, 24)
+    print(f'\nmean time for the last file to finish: {completion_times_seconds.max(axis=1).mean():.3f} s')
@@ -0,0 +1,25 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+
+
+from NetworkingCalculators import RoutingTable
+
+
+if __name__ == '__main__':
+    routing_table = [  # binary (spaces every EIGHT binary digits) or CIDR strings both work
+        '10011110 00011110 10001111',
+        '10011110 00011110 10001111 000',
+        '10011110 00011110 10001111 01',
+        '158.30.142.0/28'
+    ]
+    default_port = 4
+    ip_address_dotted_decimal = '158.30.142.3'
+
+    # compile once, then look up as many addresses as needed
+    compiled_table = RoutingTable(routing_table)
+    routing_match_index = compiled_table.lookup(ip_address_dotted_decimal)
+
+    if routing_match_index is None:
+        print('\nnone matched; using default port', default_port)
+    else:
+        print('\nprefix match output port:', routing_match_index, '\nprefix matched:', routing_table[routing_match_index])
@@ -0,0 +1,24 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+
+
+from NetworkingCalculators import RoutingTable
+
+
+if __name__ == '__main__':
+    routing_table = RoutingTable([
+        '158.30.0.0/16',
+        '158.30.142.0/24'
+    ], cache_size=1024)
+    destinations = ['158.30.142.30', '158.30.1.1', '158.30.142.30', '158.30.142.30', '10.0.0.1']
+
+    for destination in destinations:
+        print(destination, '-> route ID', routing_table.lookup(destination))
+
+    # a more specific route invalidates only the cached destinations it covers
+    routing_table.insert_route('158.30.142.16/28')
+    print('after announcing 158.30.142.16/28:', routing_table.lookup('158.30.142.30'))
+
+    cache = routing_table.destination_cache
+    print(f'\ncache hits: {cache.hit_count}, misses: {cache.miss_count}, evictions: {cache.eviction_count}, '
+          f'invalidations: {cache.invalidation_count}')
@@ -0,0 +1,26 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+
+
+from NetworkingCalculators import RoutingTable
+
+
+if __name__ == '__main__':
+    routing_table = RoutingTable([
+        '158.30.0.0/16',
+        '158.30.142.0/24'
+    ])
+    ip_address_dotted_decimal = '158.30.142.30'
+    print('\nbefore updates, matched route ID:', routing_table.lookup(ip_address_dotted_decimal))
+
+    # route IDs stay the same as routes come and go
+    updates = [
+        ('announce', '158.30.142.0/28'),
+        ('withdraw', '158.30.142.0/24'),
+        ('withdraw', 2),  # withdraw by route ID
+        ('announce', '158.30.128.0/17')
+    ]
+    route_ids = routing_table.apply_updates(updates)
+    print('route ID of each update:', route_ids)
+
+    print('after updates, matched route ID:', routing_table.lookup(ip_address_dotted_decimal))
@@ -0,0 +1,23 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+
+from NetworkingCalculators import RttEstimator
+
+
+if __name__ == '__main__':
+    rtt_estimator = RttEstimator(estimated_rtt_ms=47.5, dev_rtt_ms=4.2)
+    sample_rtts_ms = [33.1, 24.8, 11.1]  # most recent last
+
+    for sample_rtt_ms in sample_rtts_ms:
+        rtt_estimator.add_sample(sample_rtt_ms)
+        print(f'sample {sample_rtt_ms:5.1f} ms -> estimated RTT {rtt_estimator.estimated_rtt_ms:7.3f} ms, '
+              f'dev RTT {rtt_estimator.dev_rtt_ms:7.3f} ms, timeout {rtt_estimator.timeout_interval_ms:7.3f} ms')
+
+    # a timeout doubles the timeout interval; an ACK for the retransmitted segment is ambiguous, so it's ignored
+    print('timeout interval after a timeout (ms):', rtt_estimator.on_timeout())
+    print('retransmitted sample used:', rtt_estimator.add_sample(250.0, retransmitted=True))
+    print('timeout interval (ms):', rtt_estimator.timeout_interval_ms)
+
+    # the next unambiguous sample clears the backoff
+    rtt_estimator.add_sample(30.2)
+    print('timeout interval after a new sample (ms):', rtt_estimator.timeout_interval_ms)
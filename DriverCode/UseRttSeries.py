@@ -0,0 +1,26 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+
+import numpy as np
+
+from NetworkingCalculators import calculate_rtt_series_ms
+
+
+if __name__ == '__main__':
+    # two connections, one row each; most recent sample last
+    sample_rtts_ms = np.array([
+        [33.1, 24.8, 11.1, 40.2, 38.0],
+        [120.0, 118.5, 131.2, 99.9, 102.4],
+    ])
+
+    result = calculate_rtt_series_ms(sample_rtts_ms, estimated_rtt_ms=[47.5, 110.0], alpha=0.4)
+    for connection_index in range(len(sample_rtts_ms)):
+        print(f'connection {connection_index}:')
+        print('  estimated RTT (ms):', np.round(result['estimated_rtts_ms'][connection_index], 3))
+        print('  dev RTT (ms):      ', np.round(result['dev_rtts_ms'][connection_index], 3))
+        print('  timeout (ms):      ', np.round(result['timeout_intervals_ms'][connection_index], 3))
+
+    # same samples with the RFC 6298 one second floor on the timeout interval
+    clamped_result = calculate_rtt_series_ms(sample_rtts_ms, estimated_rtt_ms=[47.5, 110.0], alpha=0.4,
+                                             min_timeout_interval_ms=1000)
+    print('clamped timeouts (ms):', np.round(clamped_result['timeout_intervals_ms'], 3).tolist())
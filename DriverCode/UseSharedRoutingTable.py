@@ -0,0 +1,23 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+
+
+from NetworkingCalculators import RoutingTable, SharedRoutingTable, lookup_in_process_pool, ip_addresses_to_ints
+
+
+if __name__ == '__main__':
+    routing_table = RoutingTable([
+        '158.30.0.0/16',
+        '158.30.142.0/24',
+        '158.30.142.16/28'
+    ])
+    ip_addresses = ip_addresses_to_ints(['158.30.142.30', '158.30.1.1', '10.0.0.1'] * 10000)
+
+    # one copy of the table in shared memory; every worker attaches to it
+    shared_table = SharedRoutingTable.from_routing_table(routing_table)
+    try:
+        route_indices = lookup_in_process_pool(shared_table, ip_addresses, worker_count=4)
+        print('route index of the first 3 addresses:', route_indices[:3])
+    finally:
+        shared_table.close()
+        shared_table.unlink()
@@ -0,0 +1,27 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+
+from NetworkingCalculators import iterate_tcp_slowstart_groups, kibs_to_bytes, simulate_tcp_slowstart
+
+
+if __name__ == '__main__':
+    mss_bytes = 1460
+    slowstart_congestion_window_limit_bytes = 11680
+
+    # each group's packets as a range, so a huge transfer doesn't build a list per packet
+    packet_count = 16
+    for group in simulate_tcp_slowstart(mss_bytes, slowstart_congestion_window_limit_bytes, packet_count,
+                                        as_ranges=True):
+        print(group)
+
+    # a billion packets, one group at a time
+    group_count = 0
+    for group in iterate_tcp_slowstart_groups(mss_bytes, slowstart_congestion_window_limit_bytes, 1_000_000_000):
+        group_count += 1
+    print('\ngroups (round trips) to send a billion packets:', group_count)
+    print('last group:', group)
+
+    # sizes from the unit converters are floats, which work the same as ints
+    print()
+    for group in simulate_tcp_slowstart(kibs_to_bytes(1.5), kibs_to_bytes(12), 10, packet_size_bytes=1460.0):
+        print(group)
@@ -0,0 +1,27 @@
+# Author: Mark Mendez
+# Date: 10/18/2026
+
+from NetworkingCalculators import TcpSimulator
+
+
+if __name__ == '__main__':
+    mss_bytes = 1460
+    slowstart_congestion_window_limit_bytes = 11680
+    rtt_seconds = 0.05
+    loss_probability = 0.01  # chance of each segment being lost
+    segment_count = 2000
+
+    tcp_simulator = TcpSimulator(mss_bytes, slowstart_congestion_window_limit_bytes, rtt_seconds, loss_probability,
+                                 seed=1, record_congestion_window=True)
+    for congestion_control in ('reno', 'newreno', 'cubic'):
+        tcp_simulator.add_flow(segment_count, congestion_control)
+
+    for flow_result in tcp_simulator.run():
+        print(f"{flow_result['congestion_control']}: done in {flow_result['completion_time_seconds']:.3f} s, "
+              f"{flow_result['retransmission_count']} retransmissions "
+              f"({flow_result['fast_retransmit_count']} fast retransmits, {flow_result['timeout_count']} timeouts)")
+        # congestion window once per RTT, for the first second
+        history = flow_result['congestion_window_history']
+        samples = [next(cwnd for time, cwnd in history if time >= t * rtt_seconds) for t in range(20)]
+        print('  cwnd (MSS) each RTT:', ' '.join(f'{cwnd:.1f}' for cwnd in samples))
+    print('events processed:', tcp_simulator.event_count)